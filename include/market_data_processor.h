@@ -8,6 +8,8 @@
 #include <memory>
 #include <vector>
 #include <chrono>
+#include <mutex>
+#include <condition_variable>
 
 namespace UltraFastAnalysis {
 
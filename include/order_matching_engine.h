@@ -9,6 +9,8 @@
 #include <memory>
 #include <functional>
 #include <chrono>
+#include <mutex>
+#include <condition_variable>
 
 namespace UltraFastAnalysis {
 
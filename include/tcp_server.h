@@ -8,6 +8,8 @@
 #include <atomic>
 #include <functional>
 #include <unordered_map>
+#include <mutex>
+#include <shared_mutex>
 
 namespace UltraFastAnalysis {
 
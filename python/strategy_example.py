@@ -6,11 +6,11 @@ This example demonstrates how to create a simple algorithmic trading strategy
 using the C++ order matching engine via Python bindings.
 """
 
-import time
-import random
+import asyncio
+import signal
+import sys
 import numpy as np
 from typing import Dict, List, Optional
-from dataclasses import dataclass
 from datetime import datetime
 
 # Import the C++ engine bindings
@@ -18,28 +18,117 @@ try:
     from order_engine_python import (
         OrderMatchingEngine, Order, MarketData, OrderBookSnapshot,
         PerformanceMonitor, ORDER_SIDE_BUY, ORDER_SIDE_SELL,
-        ORDER_TYPE_LIMIT, MARKET_DATA_TYPE_TICK
+        ORDER_TYPE_LIMIT, MARKET_DATA_TYPE_TICK, ORDER_ROW_DTYPE,
+        ORDER_ROW_SIDE_BUY, ORDER_ROW_SIDE_SELL, ORDER_ROW_TYPE_LIMIT
     )
 except ImportError:
     print("Error: Could not import order_engine_python module.")
     print("Make sure the C++ engine is built with Python bindings enabled.")
     exit(1)
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to vectorized NumPy
+    njit = None
+
+if njit is not None:
+    # Native loop over the batched top-of-book: no interpreter dispatch
+    # per symbol, and the compare autovectorizes across the whole batch.
+    # No fastmath: prices are NaN until a symbol first quotes, and
+    # fastmath makes NaN comparisons undefined, so a never-quoted symbol
+    # could spuriously fire. The > 0 guard mirrors the C++ spread
+    # trigger's validity check.
+    @njit(cache=True)
+    def find_arb(bid, ask, thr, out):
+        for i in range(bid.shape[0]):
+            out[i] = bid[i] > 0.0 and ask[i] > 0.0 and (ask[i] - bid[i]) > thr
+else:
+    def find_arb(bid, ask, thr, out):
+        np.greater(np.subtract(ask, bid), thr, out=out)
+        np.logical_and(out, bid > 0.0, out=out)
+        np.logical_and(out, ask > 0.0, out=out)
+
 
-@dataclass
 class Position:
-    """Represents a trading position for a symbol."""
-    symbol: str
-    quantity: int
-    avg_price: float
-    pnl: float = 0.0
-    
+    """
+    Represents a trading position for a symbol.
+
+    Slotted plain class rather than a dataclass: attributes live in a fixed
+    C array instead of a per-instance __dict__, which shrinks each position
+    and makes the hot attribute loads one indirection cheaper.
+    """
+
+    __slots__ = ('symbol', 'quantity', 'avg_price', 'pnl')
+
+    def __init__(self, symbol: str, quantity: int, avg_price: float, pnl: float = 0.0):
+        self.symbol = symbol
+        self.quantity = quantity
+        self.avg_price = avg_price
+        self.pnl = pnl
+
     def update_pnl(self, current_price: float):
-        """Update PnL based on current market price."""
-        if self.quantity > 0:  # Long position
-            self.pnl = (current_price - self.avg_price) * self.quantity
-        else:  # Short position
-            self.pnl = (self.avg_price - current_price) * abs(self.quantity)
+        """Update PnL based on current market price.
+
+        Branchless: signed quantity already yields the right sign for both
+        long and short, so no long/short test or abs() is needed.
+        """
+        self.pnl = (current_price - self.avg_price) * self.quantity
+
+
+class OrderPool:
+    """
+    Fixed-size LIFO free list of pre-constructed Order objects.
+
+    Constructing an Order on every market-data callback churns the allocator
+    and adds GC pressure on the hot path; the engine copies the order on
+    submit_order, so a pooled Order can be reset and reused immediately after
+    submission.
+    """
+
+    __slots__ = ('_free', '_cap')
+
+    def __init__(self, cap: int = 64):
+        self._cap = cap
+        self._free = [Order(0, 0, "", ORDER_SIDE_BUY, ORDER_TYPE_LIMIT, 0, 0.0)
+                      for _ in range(cap)]
+
+    def acquire(self, order_id: int, client_id: int, symbol: str, side: str,
+                order_type: str, quantity: int, price: float) -> Order:
+        """Pop a pooled Order and re-initialize its fields in place."""
+        if self._free:
+            order = self._free.pop()
+            order.reset(order_id, client_id, symbol, side, order_type, quantity, price)
+            return order
+        return Order(order_id, client_id, symbol, side, order_type, quantity, price)
+
+    def release(self, order: Order):
+        """Return an Order to the pool for reuse."""
+        if len(self._free) < self._cap:
+            self._free.append(order)
+
+
+# Shared pool for all strategy order submissions
+ORDER_POOL = OrderPool()
+
+
+def _compile_dispatch(symbols, handler):
+    """Generate a market-data dispatcher specialized to a fixed symbol set.
+
+    The symbol set is known at init, so partial-evaluate the dispatch into
+    straight-line code: an if/elif chain of interned-string compares with
+    the symbol index hard-coded at each call site. No dict lookup, no self
+    attribute loads, and CPython's inline caches hit on every tick.
+    """
+    lines = ["def _dispatch(market_data):",
+             "    symbol = market_data.symbol"]
+    branch = "if"
+    for i, symbol in enumerate(symbols):
+        lines.append(f"    {branch} symbol == {symbol!r}:")
+        lines.append(f"        handler(market_data, {i})")
+        branch = "elif"
+    namespace = {"handler": handler}
+    exec("\n".join(lines), namespace)
+    return namespace["_dispatch"]
 
 
 class SimpleArbitrageStrategy:
@@ -47,128 +136,184 @@ class SimpleArbitrageStrategy:
     A simple arbitrage strategy that looks for price differences between
     bid and ask prices and places orders when the spread is favorable.
     """
-    
-    def __init__(self, engine: OrderMatchingEngine, symbols: List[str]):
+
+    # Side/type constants resolved once at class-creation time: order
+    # submission loads them off the class instead of re-resolving a module
+    # global per call, and interning keeps the binding's string compare on
+    # the pointer-equality fast path.
+    _BUY = sys.intern(ORDER_SIDE_BUY)
+    _SELL = sys.intern(ORDER_SIDE_SELL)
+    _LIMIT = sys.intern(ORDER_TYPE_LIMIT)
+
+    def __init__(self, engine: OrderMatchingEngine, symbols: List[str],
+                 verbose: bool = False):
+        # Interned symbols make every dict/set lookup on the tick path hit
+        # the pointer-equality fast path
+        symbols = [sys.intern(s) for s in symbols]
         self.engine = engine
         self.symbols = symbols
+        # Hot-path prints are stdout writes under the GIL; keep them off
+        # unless explicitly requested
+        self.verbose = verbose
         self.positions: Dict[str, Position] = {}
-        self.order_id_counter = 10000
         self.min_spread_threshold = 0.02  # 2 cents minimum spread
         self.max_position_size = 1000
-        
-        # Initialize positions
+
+        # Cached top-of-book, stored as parallel arrays indexed by symbol.
+        # Updated directly from the market-data callback so the per-tick
+        # path never copies an order book snapshot or touches dicts.
+        self.sym2idx = {s: i for i, s in enumerate(symbols)}
+        n = len(symbols)
+        self.bid_px = np.full(n, np.nan)
+        self.ask_px = np.full(n, np.nan)
+        self.last_px = np.zeros(n)
+
+        # Positions as parallel arrays (SoA): one vectorized expression
+        # updates PnL for every symbol instead of N Python method calls.
+        # The sign of qty encodes long/short, so no branch is needed.
+        self.qty = np.zeros(n, dtype=np.int64)
+        self.avg_px = np.zeros(n)
+        self.pnl = np.zeros(n)
+        self._pnl_tmp = np.zeros(n)
+
+        # Spread decision state: find_arb writes the fire mask, and the
+        # last-fired tops dedupe so an unchanged book never re-fires.
+        self._fire_mask = np.zeros(n, dtype=bool)
+        self._fired_bid = np.full(n, np.nan)
+        self._fired_ask = np.full(n, np.nan)
+
+        # Per-symbol Position objects remain as the reporting view; the
+        # arrays above are authoritative on the hot path.
         for symbol in symbols:
             self.positions[symbol] = Position(symbol, 0, 0.0)
-        
-        # Set up market data callback
-        self.engine.set_market_data_callback(self.on_market_data)
-        
+
+        # Reusable summary buffer: get_portfolio_summary mutates this in
+        # place on every call instead of rebuilding the nested dicts.
+        # Callers that need a stable snapshot must copy it.
+        self._summary = {
+            "total_pnl": 0.0,
+            "total_value": 0.0,
+            "positions": {s: {"quantity": 0, "avg_price": 0.0, "pnl": 0.0}
+                          for s in symbols},
+        }
+
+        # Subscribe the symbol-specialized dispatcher (multicast: co-exists
+        # with other strategies); on_market_data stays as the generic entry
+        # point for direct callers.
+        self._dispatch = _compile_dispatch(symbols, self._handle_tick)
+        self.engine.add_market_data_subscriber(self._dispatch)
+
         print(f"Strategy initialized for symbols: {symbols}")
-    
+
     def on_market_data(self, market_data: MarketData):
         """Handle incoming market data updates."""
-        symbol = market_data.symbol
-        if symbol not in self.symbols:
-            return
-        
-        # Update position PnL
-        if symbol in self.positions:
-            self.positions[symbol].update_pnl(market_data.price)
-        
-        # Check for arbitrage opportunities
-        self.check_arbitrage_opportunities(symbol)
-    
-    def check_arbitrage_opportunities(self, symbol: str):
-        """Check if there are arbitrage opportunities for a symbol."""
-        try:
-            snapshot = self.engine.get_order_book_snapshot(symbol)
-            
-            if not snapshot.bids or not snapshot.asks:
-                return
-            
-            # Get best bid and ask
-            best_bid = snapshot.bids[0]["price"]
-            best_ask = snapshot.asks[0]["price"]
-            
+        idx = self.sym2idx.get(market_data.symbol)
+        if idx is not None:
+            self._handle_tick(market_data, idx)
+
+    def _handle_tick(self, market_data: MarketData, idx: int):
+        """Per-tick work with the symbol index already resolved."""
+        # Update cached top-of-book
+        self.last_px[idx] = market_data.price
+        if market_data.bid_price > 0.0:
+            self.bid_px[idx] = market_data.bid_price
+        if market_data.ask_price > 0.0:
+            self.ask_px[idx] = market_data.ask_price
+
+        # Update PnL for all positions in one vectorized pass
+        np.subtract(self.last_px, self.avg_px, out=self._pnl_tmp)
+        np.multiply(self._pnl_tmp, self.qty, out=self.pnl)
+
+        # Batched spread decision: one native pass over every symbol writes
+        # the fire mask; Python only acts on hits whose top actually moved.
+        find_arb(self.bid_px, self.ask_px, self.min_spread_threshold,
+                 self._fire_mask)
+        for i in np.nonzero(self._fire_mask)[0]:
+            bid, ask = self.bid_px[i], self.ask_px[i]
+            if bid == self._fired_bid[i] and ask == self._fired_ask[i]:
+                continue
+            self._fired_bid[i] = bid
+            self._fired_ask[i] = ask
+            self.on_spread_fire(self.symbols[i], float(bid), float(ask))
+
+    def on_spread_fire(self, symbol: str, best_bid: float, best_ask: float):
+        """Handle a spread hit reported by the batched find_arb scan.
+
+        No try/except here or below: the C++ dispatch boundary carries the
+        single exception guard, so hot frames stay small.
+        """
+        if self.verbose:
             spread = best_ask - best_bid
-            
-            if spread > self.min_spread_threshold:
-                print(f"Arbitrage opportunity detected for {symbol}:")
-                print(f"  Best bid: {best_bid:.2f}")
-                print(f"  Best ask: {best_ask:.2f}")
-                print(f"  Spread: {spread:.2f}")
-                
-                # Place arbitrage orders
-                self.place_arbitrage_orders(symbol, best_bid, best_ask)
-        
-        except Exception as e:
-            print(f"Error checking arbitrage for {symbol}: {e}")
-    
+            print(f"Arbitrage opportunity detected for {symbol}:")
+            print(f"  Best bid: {best_bid:.2f}")
+            print(f"  Best ask: {best_ask:.2f}")
+            print(f"  Spread: {spread:.2f}")
+
+        # Place arbitrage orders
+        self.place_arbitrage_orders(symbol, best_bid, best_ask)
+
     def place_arbitrage_orders(self, symbol: str, bid_price: float, ask_price: float):
         """Place buy and sell orders for arbitrage."""
-        position = self.positions[symbol]
-        
+        position_qty = int(self.qty[self.sym2idx[symbol]])
+
         # Calculate order quantities based on current position
-        if position.quantity >= self.max_position_size:
+        if position_qty >= self.max_position_size:
             # Already at max position, can only sell
-            self.place_order(symbol, ORDER_SIDE_SELL, ORDER_TYPE_LIMIT, 100, ask_price)
-        elif position.quantity <= -self.max_position_size:
+            self.place_order(symbol, self._SELL, self._LIMIT, 100, ask_price)
+        elif position_qty <= -self.max_position_size:
             # Already at max short position, can only buy
-            self.place_order(symbol, ORDER_SIDE_BUY, ORDER_TYPE_LIMIT, 100, bid_price)
+            self.place_order(symbol, self._BUY, self._LIMIT, 100, bid_price)
         else:
             # Can place both orders
-            self.place_order(symbol, ORDER_SIDE_BUY, ORDER_TYPE_LIMIT, 100, bid_price)
-            self.place_order(symbol, ORDER_SIDE_SELL, ORDER_TYPE_LIMIT, 100, ask_price)
+            self.place_order(symbol, self._BUY, self._LIMIT, 100, bid_price)
+            self.place_order(symbol, self._SELL, self._LIMIT, 100, ask_price)
     
     def place_order(self, symbol: str, side: str, order_type: str, 
                    quantity: int, price: float) -> bool:
         """Place an order with the engine."""
-        try:
-            order = Order(
-                order_id=self.order_id_counter,
-                client_id=1,  # Strategy client ID
-                symbol=symbol,
-                side=side,
-                type=order_type,
-                quantity=quantity,
-                price=price
-            )
-            
-            success = self.engine.submit_order(order)
+        # Ids come from one relaxed atomic increment in the engine:
+        # unique across every strategy in the process, no Python-side
+        # counter to race on or to skip/reuse after a failed submit.
+        order = ORDER_POOL.acquire(self.engine.next_order_id(), 1, symbol,
+                                   side, order_type, quantity, price)
+        success = self.engine.submit_order(order)
+        ORDER_POOL.release(order)
+        if self.verbose:
             if success:
-                self.order_id_counter += 1
                 print(f"Order placed: {side} {quantity} {symbol} @ {price:.2f}")
-                return True
             else:
                 print(f"Failed to place order: {side} {quantity} {symbol} @ {price:.2f}")
-                return False
-        
-        except Exception as e:
-            print(f"Error placing order: {e}")
-            return False
+        return success
     
     def get_portfolio_summary(self) -> Dict:
-        """Get a summary of the current portfolio."""
-        total_pnl = 0.0
-        total_value = 0.0
-        
+        """Get a summary of the current portfolio.
+
+        Returns a buffer reused across calls (zero allocations per call);
+        copy it if a stable snapshot is needed.
+        """
+        # One bulk fetch of every book's top, then a single reduction:
+        # no per-symbol snapshot copies
+        bids, asks = self.engine.get_tops(self.symbols)
+        mid = 0.5 * (bids + asks)
+        valid = (bids > 0.0) & (asks > 0.0)
+
+        summary = self._summary
+        summary["total_pnl"] = float(self.pnl.sum())
+        summary["total_value"] = float(np.abs(self.qty[valid]).dot(mid[valid]))
+
+        pos_out = summary["positions"]
         for symbol, position in self.positions.items():
-            total_pnl += position.pnl
-            # Get current market price for position value
-            try:
-                snapshot = self.engine.get_order_book_snapshot(symbol)
-                if snapshot.bids and snapshot.asks:
-                    mid_price = (snapshot.bids[0]["price"] + snapshot.asks[0]["price"]) / 2
-                    total_value += abs(position.quantity) * mid_price
-            except:
-                pass
-        
-        return {
-            "total_pnl": total_pnl,
-            "total_value": total_value,
-            "positions": {s: {"quantity": p.quantity, "avg_price": p.avg_price, "pnl": p.pnl} 
-                         for s, p in self.positions.items()}
-        }
+            # Sync the reporting view from the authoritative arrays
+            idx = self.sym2idx[symbol]
+            position.quantity = int(self.qty[idx])
+            position.avg_price = float(self.avg_px[idx])
+            position.pnl = float(self.pnl[idx])
+            entry = pos_out[symbol]
+            entry["quantity"] = position.quantity
+            entry["avg_price"] = position.avg_price
+            entry["pnl"] = position.pnl
+
+        return summary
     
     def print_status(self):
         """Print current strategy status."""
@@ -200,112 +345,156 @@ class MarketMakingStrategy:
     around the current market price.
     """
     
-    def __init__(self, engine: OrderMatchingEngine, symbols: List[str]):
+    def __init__(self, engine: OrderMatchingEngine, symbols: List[str],
+                 verbose: bool = False):
+        symbols = [sys.intern(s) for s in symbols]
         self.engine = engine
         self.symbols = symbols
+        self.verbose = verbose
         self.spread_multiplier = 0.001  # 0.1% spread
         self.order_size = 100
-        self.active_orders: Dict[str, List[int]] = {symbol: [] for symbol in symbols}
-        
-        # Set up market data callback
-        self.engine.set_market_data_callback(self.on_market_data)
-        
+
+        # Active orders as one flat int64 array of [bid_id, ask_id] slots
+        # per symbol (-1 = empty): cancels go through one bulk call on a
+        # contiguous buffer instead of per-element Python list traffic.
+        # The sym2idx probe doubles as the O(1) symbol membership test.
+        self.sym2idx = {s: i for i, s in enumerate(symbols)}
+        self.active = np.full((len(symbols), 2), -1, dtype=np.int64)
+
+        # Last quoted tick per symbol, in int64 cents (-1 = never quoted).
+        # Fixed-point quotes are deterministic, so an unchanged mid maps to
+        # the same ticks and the cancel/replace round-trip can be skipped.
+        self.last_bid_cents = np.full(len(symbols), -1, dtype=np.int64)
+        self.last_ask_cents = np.full(len(symbols), -1, dtype=np.int64)
+
+        # Reusable two-row batch (bid, ask): each requote rewrites the ids
+        # and prices in place and submits both sides in one engine call.
+        self._order_batch = np.zeros(2, dtype=ORDER_ROW_DTYPE)
+        self._order_batch['client_id'] = 2
+        self._order_batch['side'] = (ORDER_ROW_SIDE_BUY, ORDER_ROW_SIDE_SELL)
+        self._order_batch['type'] = ORDER_ROW_TYPE_LIMIT
+        self._order_batch['quantity'] = self.order_size
+
+        # Subscribe the symbol-specialized dispatcher (multicast: co-exists
+        # with other strategies); on_market_data stays as the generic entry
+        # point for direct callers.
+        self._dispatch = _compile_dispatch(symbols, self._handle_tick)
+        self.engine.add_market_data_subscriber(self._dispatch)
+
         print(f"Market Making Strategy initialized for symbols: {symbols}")
-    
+
     def on_market_data(self, market_data: MarketData):
         """Handle incoming market data updates."""
-        symbol = market_data.symbol
-        if symbol not in self.symbols:
+        idx = self.sym2idx.get(market_data.symbol)
+        if idx is not None:
+            self._handle_tick(market_data, idx)
+
+    def _handle_tick(self, market_data: MarketData, idx: int):
+        """Per-tick work with the symbol index already resolved."""
+        self.update_market_making_orders(self.symbols[idx], idx)
+
+    def update_market_making_orders(self, symbol: str, idx: int):
+        """Update market making orders for a symbol.
+
+        Runs unguarded: the C++ dispatch boundary catches and logs any
+        exception, so this frame carries no exception table.
+        """
+        snapshot = self.engine.get_order_book_snapshot(symbol)
+        bids = snapshot.bids_array
+        asks = snapshot.asks_array
+
+        if not bids.size or not asks.size:
             return
-        
-        # Update market making orders
-        self.update_market_making_orders(symbol)
-    
-    def update_market_making_orders(self, symbol: str):
-        """Update market making orders for a symbol."""
-        try:
-            snapshot = self.engine.get_order_book_snapshot(symbol)
-            
-            if not snapshot.bids or not snapshot.asks:
-                return
-            
-            # Calculate mid price
-            mid_price = (snapshot.bids[0]["price"] + snapshot.asks[0]["price"]) / 2
-            
-            # Calculate bid and ask prices
-            bid_price = mid_price * (1 - self.spread_multiplier)
-            ask_price = mid_price * (1 + self.spread_multiplier)
-            
-            # Cancel existing orders
-            for order_id in self.active_orders[symbol]:
-                self.engine.cancel_order(order_id, symbol)
-            self.active_orders[symbol].clear()
-            
-            # Place new orders
-            bid_order = Order(20000 + len(self.active_orders[symbol]), 2, symbol, 
-                            ORDER_SIDE_BUY, ORDER_TYPE_LIMIT, self.order_size, bid_price)
-            ask_order = Order(30000 + len(self.active_orders[symbol]), 2, symbol, 
-                            ORDER_SIDE_SELL, ORDER_TYPE_LIMIT, self.order_size, ask_price)
-            
-            if self.engine.submit_order(bid_order):
-                self.active_orders[symbol].append(bid_order.order_id)
-            if self.engine.submit_order(ask_order):
-                self.active_orders[symbol].append(ask_order.order_id)
-            
+
+        # Quote in int64 cents: tick-aligned integer arithmetic instead of
+        # FP multiplies, and deterministic so requotes can be deduplicated.
+        # mid*100 cents == (bid+ask)*50.
+        mid_cents = int(round((bids['price'][0] + asks['price'][0]) * 50.0))
+        half_cents = max(1, int(mid_cents * self.spread_multiplier))
+        bid_cents = mid_cents - half_cents
+        ask_cents = mid_cents + half_cents
+
+        # Same ticks as the live quotes: nothing to do, skip the whole
+        # cancel/replace round-trip.
+        if (bid_cents == self.last_bid_cents[idx]
+                and ask_cents == self.last_ask_cents[idx]):
+            return
+        self.last_bid_cents[idx] = bid_cents
+        self.last_ask_cents[idx] = ask_cents
+
+        # Cancel existing orders in one bulk call
+        ids = self.active[idx]
+        if ids[0] >= 0 or ids[1] >= 0:
+            self.engine.cancel_orders_bulk(ids, symbol)
+            ids[:] = -1
+
+        # Requote both sides through one boundary crossing: rewrite the
+        # reusable batch in place and submit it in a single engine call.
+        # A row the engine rejects just leaves a dead id behind, which the
+        # next bulk cancel skips harmlessly.
+        batch = self._order_batch
+        batch['order_id'] = (self.engine.next_order_id(),
+                             self.engine.next_order_id())
+        batch['price_cents'] = (bid_cents, ask_cents)
+        self.engine.submit_orders(batch, symbol)
+        ids[:] = batch['order_id']
+
+        if self.verbose:
             print(f"Updated market making orders for {symbol}: "
-                  f"Bid @ {bid_price:.2f}, Ask @ {ask_price:.2f}")
-        
-        except Exception as e:
-            print(f"Error updating market making orders for {symbol}: {e}")
+                  f"Bid @ {bid_cents * 0.01:.2f}, Ask @ {ask_cents * 0.01:.2f}")
 
 
-def run_strategy_demo():
+async def run_strategy_demo():
     """Run a demonstration of the trading strategies."""
     print("=== Ultra-Fast Analysis Strategy Demo ===")
-    
+
     # Create the order matching engine
     engine = OrderMatchingEngine(num_matching_threads=4, num_market_data_threads=2)
-    
+
     try:
         # Start the engine
         if not engine.start():
             print("Failed to start order matching engine")
             return
-        
+
         print("Order matching engine started successfully")
-        
+
         # Define symbols to trade
         symbols = ["AAPL", "GOOGL", "MSFT"]
-        
+
         # Create strategies
         arbitrage_strategy = SimpleArbitrageStrategy(engine, symbols)
         market_making_strategy = MarketMakingStrategy(engine, symbols)
-        
+
         print("Strategies created and running...")
         print("Press Ctrl+C to stop...")
-        
-        # Main loop
-        start_time = time.time()
-        while True:
-            try:
-                # Print status every 10 seconds
-                if int(time.time() - start_time) % 10 == 0:
+
+        # Async shell around the engine's own threads: the status cadence
+        # is a timed wait on the shutdown event, so future data feeds or
+        # admin endpoints can share this loop without extra threads or
+        # sleep-and-poll wakeups.
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGINT, stop.set)
+        try:
+            while not stop.is_set():
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=10.0)
+                except asyncio.TimeoutError:
                     arbitrage_strategy.print_status()
-                
-                time.sleep(1)
-                
-            except KeyboardInterrupt:
-                print("\nShutting down...")
-                break
-        
+        finally:
+            loop.remove_signal_handler(signal.SIGINT)
+
+        print("\nShutting down...")
+
         # Stop the engine
         engine.stop()
         print("Strategy demo completed")
-        
+
     except Exception as e:
         print(f"Error in strategy demo: {e}")
         engine.stop()
 
 
 if __name__ == "__main__":
-    run_strategy_demo()
+    asyncio.run(run_strategy_demo())
@@ -9,199 +9,572 @@ This module provides visualization capabilities for analyzing:
 - Market data patterns
 """
 
+import hashlib
+import io
+import os
+import time
+
+import matplotlib
+# Embedded dashboards that only render PNG bytes should not pay for a
+# GUI backend's event loop; must be selected before pyplot is imported
+if os.environ.get('MPL_NONINTERACTIVE', '0') == '1':
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
+from matplotlib.ticker import FuncFormatter
 import numpy as np
 import pandas as pd
+from collections import deque
 from typing import Dict, List, Optional, Tuple
-import seaborn as sns
+from weakref import WeakValueDictionary
 from datetime import datetime, timedelta
 import json
 
-# Set style for better-looking plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+try:
+    import pybase64 as _base64  # drop-in, ~2-4x faster encode
+except ImportError:
+    import base64 as _base64
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to vectorized NumPy
+    njit = None
 
-class OrderBookVisualizer:
-    """Visualize order book depth and structure."""
-    
-    def __init__(self):
+try:
+    from vispy import scene as _vispy_scene  # optional GPU renderer
+except ImportError:
+    _vispy_scene = None
+
+# Minimal styling applied directly to rcParams: parsing a full style
+# sheet (and importing seaborn just for its palette) costs ~100 ms at
+# import, which matters when this module loads inside a trading process
+plt.rcParams['axes.prop_cycle'] = plt.cycler(
+    color=['#2ecc71', '#e74c3c', '#3498db', '#f39c12'])
+plt.rcParams.update({
+    'axes.facecolor': '#eaeaf2',
+    'axes.grid': True,
+    'grid.color': 'white',
+    'axes.edgecolor': 'white',
+})
+
+
+def png_bytes(fig) -> str:
+    """Render a figure to PNG and return it base64-encoded for transport."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    return _base64.b64encode(buf.getvalue()).decode()
+
+
+class _ReusableVisualizer:
+    """Per-process instance cache shared by the visualizer classes.
+
+    Subplot construction (axes, spines, tick locators, grids) dominates
+    figure setup, so dashboards refreshed per call should reuse one
+    instance per key instead of rebuilding the grid each time. The cache
+    holds weak references: instances die with their last external owner.
+    """
+
+    def _init_clock(self):
+        """Anchor the monotonic plot clock and build the tick formatter.
+
+        Histories store float seconds since construction rather than
+        datetime objects: datetime.now() allocates per sample and
+        matplotlib re-runs date2num over the whole window on every
+        draw. Wall-clock labels are recovered lazily, only for the
+        handful of ticks actually rendered.
+        """
+        self._t0 = time.monotonic()
+        self._wall0 = time.time()
+        self._time_fmt = FuncFormatter(
+            lambda sec, _: datetime.fromtimestamp(self._wall0 + sec)
+            .strftime('%H:%M:%S'))
+
+    def _now(self) -> float:
+        """Seconds since construction on the monotonic clock."""
+        return time.monotonic() - self._t0
+
+    @classmethod
+    def get_or_create(cls, key: str = 'default'):
+        """Return the cached instance for key, constructing it on first use."""
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls()
+            cls._instances[key] = instance
+        return instance
+
+
+if njit is not None:
+    # Single native pass over the PnL window: returns sum/sum-of-squares
+    # for volatility and Sharpe plus the max drawdown, with no temporaries.
+    @njit(cache=True, fastmath=True)
+    def _risk_scan(pnl):
+        ret_sum = 0.0
+        ret_sq = 0.0
+        count = 0
+        peak = pnl[0]
+        max_drawdown = 0.0
+        for i in range(1, pnl.size):
+            prev = pnl[i - 1]
+            if prev != 0.0:
+                r = (pnl[i] - prev) / prev
+                ret_sum += r
+                ret_sq += r * r
+                count += 1
+            if pnl[i] > peak:
+                peak = pnl[i]
+            drawdown = pnl[i] - peak
+            if drawdown < max_drawdown:
+                max_drawdown = drawdown
+        return ret_sum, ret_sq, count, max_drawdown
+
+    _risk_scan(np.zeros(2))  # warm the JIT cache at import
+else:
+    def _risk_scan(pnl):
+        prev = pnl[:-1]
+        valid = prev != 0.0
+        returns = np.diff(pnl)[valid] / prev[valid]
+        max_drawdown = float(np.min(pnl - np.maximum.accumulate(pnl)))
+        return (float(returns.sum()), float(np.square(returns).sum()),
+                int(returns.size), max_drawdown)
+
+
+class VispyBackend:
+    """GPU-backed depth-line renderer built on vispy.scene.
+
+    Agg redraws every vertex on the CPU each frame; for dashboards
+    streaming many symbols at a 50 ms cadence the line geometry is
+    better swapped straight into a GPU vertex buffer. Vertices are
+    packed into pre-allocated (N, 2) position arrays so set_data only
+    re-uploads the buffer instead of reallocating it.
+    """
+
+    def __init__(self, max_levels: int):
+        if _vispy_scene is None:
+            raise ImportError(
+                "backend='vispy' requires the optional vispy package")
+        self.canvas = _vispy_scene.SceneCanvas(title='Order Book Depth',
+                                               keys='interactive', show=False)
+        self.view = self.canvas.central_widget.add_view(camera='panzoom')
+        self.bid_line = _vispy_scene.visuals.Line(color='green', width=2,
+                                                  parent=self.view.scene)
+        self.ask_line = _vispy_scene.visuals.Line(color='red', width=2,
+                                                  parent=self.view.scene)
+        self._bid_pos = np.empty((max_levels, 2), dtype=np.float32)
+        self._ask_pos = np.empty((max_levels, 2), dtype=np.float32)
+
+    def update_lines(self, bid_x, bid_y, ask_x, ask_y):
+        """Swap new depth-line vertices into the GPU buffers."""
+        nb, na = len(bid_x), len(ask_x)
+        self._bid_pos[:nb, 0] = bid_x
+        self._bid_pos[:nb, 1] = bid_y
+        self._ask_pos[:na, 0] = ask_x
+        self._ask_pos[:na, 1] = ask_y
+        self.bid_line.set_data(pos=self._bid_pos[:nb])
+        self.ask_line.set_data(pos=self._ask_pos[:na])
+        self.view.camera.set_range()
+
+
+class OrderBookVisualizer(_ReusableVisualizer):
+    """Visualize order book depth and structure.
+
+    Artists are built once in __init__ and only have their data swapped
+    per frame: ax.clear() recreates lines, legends, ticks and grids from
+    scratch on every update, which dwarfs the numeric work.
+    """
+
+    _instances = WeakValueDictionary()
+
+    MAX_LEVELS = 16   # bars pre-created for the price-level panel
+    HIST_BINS = 20
+    MAX_CUM_LEVELS = 256  # capacity of the reusable cumsum buffers
+
+    # Layout shared with the engine's snapshot bids_array/asks_array views
+    LEVEL_DTYPE = np.dtype([('price', 'f8'), ('quantity', 'u8')])
+
+    def __init__(self, disp_skip: int = 1, backend: str = 'matplotlib'):
         self.fig, self.axes = plt.subplots(2, 2, figsize=(15, 10))
         self.fig.suptitle('Order Book Visualization', fontsize=16)
-    
-    def plot_order_book_depth(self, snapshot, symbol: str):
-        """Plot order book depth chart."""
+
+        # Optional GPU path for the depth lines; matplotlib stays the
+        # default so environments without vispy are unaffected
+        self._line_backend = (VispyBackend(self.MAX_CUM_LEVELS)
+                              if backend == 'vispy' else None)
+
+        # Render every disp_skip-th update() call: callers on a per-tick
+        # cadence can keep calling while drawing at a sustainable rate
+        # (5-10 cuts draw work 5-10x with no change in caller code)
+        self.disp_skip = disp_skip
+        self._step = 0
+        self._dirty = True  # layout re-solved only when geometry changes
+
+        # One extraction per snapshot shared by all four panels, plus
+        # reusable buffers for the cumulative-depth computation
+        self._unpack_src = None
+        self._unpacked = None
+        self._last_fp = None  # content fingerprint of the last drawn book
+        self._bid_cum = np.empty(self.MAX_CUM_LEVELS)
+        self._ask_cum = np.empty(self.MAX_CUM_LEVELS)
+        self._prev_bid_qty = np.empty(0)
+        self._prev_ask_qty = np.empty(0)
+        self._spread_levels = np.arange(1, 11)  # x-axis for up to 10 levels
+
+        # Depth chart
         ax = self.axes[0, 0]
-        ax.clear()
-        
-        if not snapshot.bids or not snapshot.asks:
-            ax.text(0.5, 0.5, 'No order book data', ha='center', va='center', 
-                   transform=ax.transAxes)
-            ax.set_title(f'{symbol} - Order Book Depth')
-            return
-        
-        # Extract bid and ask data
-        bid_prices = [bid["price"] for bid in snapshot.bids]
-        bid_quantities = [bid["quantity"] for bid in snapshot.bids]
-        ask_prices = [ask["price"] for ask in snapshot.asks]
-        ask_quantities = [ask["quantity"] for ask in snapshot.asks]
-        
-        # Create cumulative quantities
-        bid_cumulative = np.cumsum(bid_quantities)
-        ask_cumulative = np.cumsum(ask_quantities)
-        
-        # Plot
-        ax.plot(bid_prices, bid_cumulative, 'g-', linewidth=2, label='Bids', alpha=0.7)
-        ax.plot(ask_prices, ask_cumulative, 'r-', linewidth=2, label='Asks', alpha=0.7)
-        
-        # Fill areas
-        ax.fill_between(bid_prices, bid_cumulative, alpha=0.3, color='green')
-        ax.fill_between(ask_prices, ask_cumulative, alpha=0.3, color='red')
-        
+        self.bid_line, = ax.plot([], [], 'g-', linewidth=2, label='Bids', alpha=0.7)
+        self.ask_line, = ax.plot([], [], 'r-', linewidth=2, label='Asks', alpha=0.7)
+        self._bid_fill = None
+        self._ask_fill = None
+        self.spread_text = ax.text(0.02, 0.98, '', transform=ax.transAxes,
+                                   verticalalignment='top',
+                                   bbox=dict(boxstyle='round', facecolor='wheat',
+                                             alpha=0.8))
+        self._depth_empty = self._make_empty_text(ax)
         ax.set_xlabel('Price')
         ax.set_ylabel('Cumulative Quantity')
-        ax.set_title(f'{symbol} - Order Book Depth')
         ax.legend()
         ax.grid(True, alpha=0.3)
-        
-        # Add spread information
+
+        # Price levels
+        ax = self.axes[0, 1]
+        self._bid_bars = ax.barh(np.arange(self.MAX_LEVELS),
+                                 np.zeros(self.MAX_LEVELS),
+                                 color='green', alpha=0.7, label='Bids')
+        self._ask_bars = ax.barh(-np.arange(self.MAX_LEVELS) - 1,
+                                 np.zeros(self.MAX_LEVELS),
+                                 color='red', alpha=0.7, label='Asks')
+        self._levels_empty = self._make_empty_text(ax)
+        ax.set_xlabel('Quantity')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+        # Spread analysis
+        ax = self.axes[1, 0]
+        self.spread_line, = ax.plot([], [], 'bo-', linewidth=2, markersize=6)
+        self._spread_fill = None
+        self.avg_hline = ax.axhline(y=0.0, color='red', linestyle='--', alpha=0.7,
+                                    label='Avg')
+        self._spread_legend = ax.legend()
+        self._spread_empty = self._make_empty_text(ax)
+        ax.set_xlabel('Price Level')
+        ax.set_ylabel('Spread ($)')
+        ax.grid(True, alpha=0.3)
+
+        # Quantity distribution
+        ax = self.axes[1, 1]
+        self._bid_hist = ax.bar(np.arange(self.HIST_BINS, dtype=float),
+                                np.zeros(self.HIST_BINS), width=1.0,
+                                alpha=0.7, color='green', label='Bids')
+        self._ask_hist = ax.bar(np.arange(self.HIST_BINS, dtype=float),
+                                np.zeros(self.HIST_BINS), width=1.0,
+                                alpha=0.7, color='red', label='Asks')
+        self._dist_empty = self._make_empty_text(ax)
+        ax.set_xlabel('Quantity')
+        ax.set_ylabel('Density')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+    @staticmethod
+    def _make_empty_text(ax):
+        """Create the hidden 'no data' placeholder for one panel."""
+        text = ax.text(0.5, 0.5, 'No order book data', ha='center', va='center',
+                       transform=ax.transAxes)
+        text.set_visible(False)
+        return text
+
+    def _unpack(self, snapshot):
+        """Return (bids, asks) as structured price/quantity arrays.
+
+        Engine snapshots expose zero-copy bids_array/asks_array views and
+        are used as-is; dict-list snapshots are converted once. The result
+        is cached so the four panels share a single extraction instead of
+        re-running list comprehensions per plot. The cache keeps a strong
+        reference to the snapshot and compares identity against it: a
+        bare id() key would collide when CPython reuses the address of a
+        freed snapshot and silently serve the previous book's arrays.
+        """
+        if snapshot is self._unpack_src:
+            return self._unpacked
+
+        bids = getattr(snapshot, 'bids_array', None)
+        if bids is not None:
+            asks = snapshot.asks_array
+        else:
+            bids = np.array([(b["price"], b["quantity"]) for b in snapshot.bids],
+                            dtype=self.LEVEL_DTYPE)
+            asks = np.array([(a["price"], a["quantity"]) for a in snapshot.asks],
+                            dtype=self.LEVEL_DTYPE)
+
+        self._unpack_src = snapshot
+        self._unpacked = (bids, asks)
+        return self._unpacked
+
+    @staticmethod
+    def _cumsum_delta(qty, prev_qty, cum):
+        """Maintain cum[:n] = cumsum(qty), recomputing only the changed tail.
+
+        Order books mostly see top-of-book or few-level changes, so the
+        running totals are valid up to the first level whose quantity
+        differs from the previous frame; everything before it is reused.
+        """
+        n = qty.size
+        if prev_qty.size == n:
+            changed = qty != prev_qty
+            if not changed.any():
+                return cum[:n]
+            first = int(np.argmax(changed))
+        else:
+            first = 0
+        np.cumsum(qty[first:], out=cum[first:n])
+        if first > 0:
+            cum[first:n] += cum[first - 1]
+        return cum[:n]
+
+    def plot_order_book_depth(self, snapshot, symbol: str):
+        """Plot order book depth chart."""
+        ax = self.axes[0, 0]
+        ax.set_title(f'{symbol} - Order Book Depth')
+
+        bids, asks = self._unpack(snapshot)
+        if not bids.size or not asks.size:
+            self._depth_empty.set_visible(True)
+            return
+        self._depth_empty.set_visible(False)
+
+        bid_prices = bids['price']
+        ask_prices = asks['price']
+
+        # Cumulative quantities into the reusable buffers, recomputed only
+        # from the first level that changed since the previous frame
+        nb = min(bids.size, self._bid_cum.size)
+        na = min(asks.size, self._ask_cum.size)
+        bid_qty = bids['quantity'][:nb]
+        ask_qty = asks['quantity'][:na]
+        bid_cumulative = self._cumsum_delta(bid_qty, self._prev_bid_qty, self._bid_cum)
+        ask_cumulative = self._cumsum_delta(ask_qty, self._prev_ask_qty, self._ask_cum)
+        self._prev_bid_qty = bid_qty.astype(np.float64)  # copy for next diff
+        self._prev_ask_qty = ask_qty.astype(np.float64)
+
+        if self._line_backend is not None:
+            # GPU path: upload the vertices and skip the Agg artists
+            self._line_backend.update_lines(bid_prices[:nb], bid_cumulative,
+                                            ask_prices[:na], ask_cumulative)
+        else:
+            # Swap data into the persistent lines
+            self.bid_line.set_data(bid_prices[:nb], bid_cumulative)
+            self.ask_line.set_data(ask_prices[:na], ask_cumulative)
+
+            # fill_between has no set_data; replace just its collection
+            if self._bid_fill is not None:
+                self._bid_fill.remove()
+                self._ask_fill.remove()
+            self._bid_fill = ax.fill_between(bid_prices[:nb], bid_cumulative,
+                                             alpha=0.3, color='green')
+            self._ask_fill = ax.fill_between(ask_prices[:na], ask_cumulative,
+                                             alpha=0.3, color='red')
+
+            ax.relim()
+            ax.autoscale_view()
+
+        # Update spread information
         spread = ask_prices[0] - bid_prices[0]
         mid_price = (bid_prices[0] + ask_prices[0]) / 2
-        ax.text(0.02, 0.98, f'Spread: ${spread:.2f}\nMid: ${mid_price:.2f}', 
-               transform=ax.transAxes, verticalalignment='top',
-               bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
-    
+        self.spread_text.set_text(f'Spread: ${spread:.2f}\nMid: ${mid_price:.2f}')
+
     def plot_price_levels(self, snapshot, symbol: str):
         """Plot individual price levels."""
         ax = self.axes[0, 1]
-        ax.clear()
-        
-        if not snapshot.bids or not snapshot.asks:
-            ax.text(0.5, 0.5, 'No order book data', ha='center', va='center', 
-                   transform=ax.transAxes)
-            ax.set_title(f'{symbol} - Price Levels')
+        ax.set_title(f'{symbol} - Price Levels')
+
+        bids, asks = self._unpack(snapshot)
+        if not bids.size or not asks.size:
+            self._levels_empty.set_visible(True)
             return
-        
-        # Extract data
-        bid_prices = [bid["price"] for bid in snapshot.bids]
-        bid_quantities = [bid["quantity"] for bid in snapshot.bids]
-        ask_prices = [ask["price"] for ask in snapshot.asks]
-        ask_quantities = [ask["quantity"] for ask in snapshot.asks]
-        
-        # Create horizontal bar chart
-        y_pos_bids = np.arange(len(bid_prices))
-        y_pos_asks = np.arange(len(ask_prices))
-        
-        ax.barh(y_pos_bids, bid_quantities, color='green', alpha=0.7, label='Bids')
-        ax.barh(-y_pos_asks-1, ask_quantities, color='red', alpha=0.7, label='Asks')
-        
+        self._levels_empty.set_visible(False)
+
+        n_bids = min(bids.size, self.MAX_LEVELS)
+        n_asks = min(asks.size, self.MAX_LEVELS)
+        bid_quantities = bids['quantity'][:n_bids]
+        ask_quantities = asks['quantity'][:n_asks]
+
+        # Resize the pre-created bars in place; unused slots collapse to 0
+        for i, rect in enumerate(self._bid_bars):
+            rect.set_width(bid_quantities[i] if i < n_bids else 0.0)
+        for i, rect in enumerate(self._ask_bars):
+            rect.set_width(ask_quantities[i] if i < n_asks else 0.0)
+
         # Set labels
-        ax.set_yticks(np.concatenate([-y_pos_asks-1, y_pos_bids]))
-        ax.set_yticklabels([f'${p:.2f}' for p in ask_prices[::-1] + bid_prices])
-        
-        ax.set_xlabel('Quantity')
-        ax.set_title(f'{symbol} - Price Levels')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-    
+        ax.set_yticks(np.concatenate([-np.arange(n_asks) - 1, np.arange(n_bids)]))
+        ax.set_yticklabels([f'${p:.2f}' for p in
+                            np.concatenate([asks['price'][n_asks - 1::-1],
+                                            bids['price'][:n_bids]])])
+
+        max_qty = max(bid_quantities.max(), ask_quantities.max())
+        ax.set_xlim(0, max_qty * 1.05)
+        ax.set_ylim(-n_asks - 1, n_bids)
+
     def plot_spread_analysis(self, snapshot, symbol: str):
         """Plot spread analysis."""
         ax = self.axes[1, 0]
-        ax.clear()
-        
-        if not snapshot.bids or not snapshot.asks:
-            ax.text(0.5, 0.5, 'No order book data', ha='center', va='center', 
-                   transform=ax.transAxes)
-            ax.set_title(f'{symbol} - Spread Analysis')
-            return
-        
-        # Calculate spreads at different levels
-        max_levels = min(len(snapshot.bids), len(snapshot.asks), 10)
-        levels = range(1, max_levels + 1)
-        spreads = []
-        
-        for i in range(max_levels):
-            spread = snapshot.asks[i]["price"] - snapshot.bids[i]["price"]
-            spreads.append(spread)
-        
-        # Plot spread by level
-        ax.plot(levels, spreads, 'bo-', linewidth=2, markersize=6)
-        ax.fill_between(levels, spreads, alpha=0.3, color='blue')
-        
-        ax.set_xlabel('Price Level')
-        ax.set_ylabel('Spread ($)')
         ax.set_title(f'{symbol} - Spread by Price Level')
-        ax.grid(True, alpha=0.3)
-        
-        # Add statistics
-        avg_spread = np.mean(spreads)
-        ax.axhline(y=avg_spread, color='red', linestyle='--', alpha=0.7, 
-                  label=f'Avg: ${avg_spread:.2f}')
-        ax.legend()
-    
+
+        bids, asks = self._unpack(snapshot)
+        if not bids.size or not asks.size:
+            self._spread_empty.set_visible(True)
+            return
+        self._spread_empty.set_visible(False)
+
+        # Spreads for all levels in one vectorized subtract; the level
+        # axis is a cached arange sliced to size
+        n = min(bids.size, asks.size, 10)
+        levels = self._spread_levels[:n]
+        spreads = asks['price'][:n] - bids['price'][:n]
+
+        # Swap data into the persistent line and fill
+        self.spread_line.set_data(levels, spreads)
+        if self._spread_fill is not None:
+            self._spread_fill.remove()
+        self._spread_fill = ax.fill_between(levels, spreads, alpha=0.3, color='blue')
+
+        # Update statistics
+        avg_spread = spreads.mean()
+        self.avg_hline.set_ydata([avg_spread, avg_spread])
+        self._spread_legend.get_texts()[0].set_text(f'Avg: ${avg_spread:.2f}')
+
+        ax.relim()
+        ax.autoscale_view()
+
     def plot_quantity_distribution(self, snapshot, symbol: str):
         """Plot quantity distribution."""
         ax = self.axes[1, 1]
-        ax.clear()
-        
-        if not snapshot.bids or not snapshot.asks:
-            ax.text(0.5, 0.5, 'No order book data', ha='center', va='center', 
-                   transform=ax.transAxes)
-            ax.set_title(f'{symbol} - Quantity Distribution')
-            return
-        
-        # Extract quantities
-        bid_quantities = [bid["quantity"] for bid in snapshot.bids]
-        ask_quantities = [ask["quantity"] for ask in snapshot.asks]
-        
-        # Create histogram
-        ax.hist(bid_quantities, bins=20, alpha=0.7, color='green', label='Bids', density=True)
-        ax.hist(ask_quantities, bins=20, alpha=0.7, color='red', label='Asks', density=True)
-        
-        ax.set_xlabel('Quantity')
-        ax.set_ylabel('Density')
         ax.set_title(f'{symbol} - Quantity Distribution')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-    
+
+        bids, asks = self._unpack(snapshot)
+        if not bids.size or not asks.size:
+            self._dist_empty.set_visible(True)
+            return
+        self._dist_empty.set_visible(False)
+
+        bid_quantities = bids['quantity']
+        ask_quantities = asks['quantity']
+
+        # Bin ourselves and reshape the pre-created bars instead of
+        # rebuilding two BarContainers per frame
+        bid_counts, bid_edges = np.histogram(bid_quantities, bins=self.HIST_BINS,
+                                             density=True)
+        ask_counts, ask_edges = np.histogram(ask_quantities, bins=self.HIST_BINS,
+                                             density=True)
+        for bars, counts, edges in ((self._bid_hist, bid_counts, bid_edges),
+                                    (self._ask_hist, ask_counts, ask_edges)):
+            widths = np.diff(edges)
+            for rect, x, w, h in zip(bars, edges, widths, counts):
+                rect.set_x(x)
+                rect.set_width(w)
+                rect.set_height(h)
+
+        ax.set_xlim(min(bid_edges[0], ask_edges[0]),
+                    max(bid_edges[-1], ask_edges[-1]))
+        top = max(bid_counts.max(), ask_counts.max())
+        ax.set_ylim(0, top * 1.05 if top > 0 else 1.0)
+
     def update(self, snapshot, symbol: str):
-        """Update all plots with new data."""
+        """Update all plots with new data (every disp_skip-th call)."""
+        self._step += 1
+        if self._step % self.disp_skip:
+            return
+        # Idle ticks often carry a byte-identical book; fingerprint the
+        # top levels and skip the whole redraw when nothing moved
+        bids, asks = self._unpack(snapshot)
+        fp = hashlib.blake2b(bids[:10].tobytes() + asks[:10].tobytes()
+                             + symbol.encode(), digest_size=8).digest()
+        if fp == self._last_fp:
+            return
+        self._last_fp = fp
         self.plot_order_book_depth(snapshot, symbol)
         self.plot_price_levels(snapshot, symbol)
         self.plot_spread_analysis(snapshot, symbol)
         self.plot_quantity_distribution(snapshot, symbol)
-        plt.tight_layout()
-    
+        # tight_layout re-solves the whole figure layout; only pay for
+        # it when panel geometry actually changed (first frame, new
+        # artists), not on every data refresh
+        if self._dirty:
+            self.fig.tight_layout()
+            self._dirty = False
+        # Schedule a repaint instead of forcing a synchronous draw, then
+        # let the GUI event loop breathe
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
+
     def show(self):
         """Display the plots."""
         plt.show()
 
 
-class PerformanceVisualizer:
+class PerformanceVisualizer(_ReusableVisualizer):
     """Visualize performance metrics and latency distributions."""
-    
-    def __init__(self):
+
+    _instances = WeakValueDictionary()
+
+    def __init__(self, disp_skip: int = 1):
         self.fig, self.axes = plt.subplots(2, 3, figsize=(18, 12))
         self.fig.suptitle('Performance Metrics Visualization', fontsize=16)
-        
-        # Store historical data
-        self.latency_history = []
-        self.throughput_history = []
-        self.timestamps = []
+
+        # Render every disp_skip-th update() call
+        self.disp_skip = disp_skip
+        self._step = 0
+        self._dirty = True  # layout re-solved only when geometry changes
+
+        # Rolling windows: deque(maxlen=...) evicts in O(1) on append,
+        # unlike list.pop(0) which shifts the whole window every sample
+        self.latency_history = deque(maxlen=1000)
+        self.throughput_history = deque(maxlen=1000)
+        self._init_clock()
+        self._last_fp = None  # fingerprint of the last rendered inputs
+        self.timestamps = deque(maxlen=1000)  # float seconds (see _init_clock)
+        self.memory_data = deque(maxlen=100)
+        self.cpu_data = deque(maxlen=100)
+
+        # Running latency histogram: bin edges are fixed after the first
+        # sample and the counts are maintained incrementally - one bin
+        # increment per sample, one decrement per eviction - instead of
+        # re-binning the whole window every frame. Samples beyond the
+        # initial range clamp into the outer bins.
+        self._lat_edges = None
+        self._lat_counts = np.zeros(30, dtype=np.int64)
+        self._lat_bins = deque(maxlen=1000)  # bin index per window sample
+        self._lat_sum = 0.0                  # running sum for the exact mean
+        self._lat_bars = None
+        self._lat_mean_line = None
+        self._lat_median_line = None
+        self._lat_legend = None
+
+        # Summary panel: a fixed grid of Text artists updated in place.
+        # ax.table rebuilds a Rectangle + Text per cell every frame and is
+        # one of matplotlib's most expensive artists.
+        ax = self.axes[1, 0]
+        ax.set_title('Performance Summary')
+        ax.axis('off')
+        self._summary_texts = []
+        for i, label in enumerate(('Orders Processed', 'Trades Executed',
+                                   'Market Data Updates', 'Avg Latency')):
+            y = 0.8 - 0.2 * i
+            ax.text(0.05, y, label, fontsize=12, transform=ax.transAxes)
+            self._summary_texts.append(
+                ax.text(0.60, y, '', fontsize=12, transform=ax.transAxes))
     
-    def plot_latency_trend(self, latencies: List[float], timestamps: List[datetime]):
+    def plot_latency_trend(self, latencies: List[float], timestamps: List[float]):
         """Plot latency trend over time."""
         ax = self.axes[0, 0]
         ax.clear()
-        
-        if not latencies:
-            ax.text(0.5, 0.5, 'No latency data', ha='center', va='center', 
+
+        if not len(latencies):
+            ax.text(0.5, 0.5, 'No latency data', ha='center', va='center',
                    transform=ax.transAxes)
             ax.set_title('Latency Trend')
             return
         
         ax.plot(timestamps, latencies, 'b-', linewidth=2, alpha=0.7)
         ax.fill_between(timestamps, latencies, alpha=0.3, color='blue')
+        ax.xaxis.set_major_formatter(self._time_fmt)
         
         ax.set_xlabel('Time')
         ax.set_ylabel('Latency (μs)')
@@ -236,52 +609,82 @@ class PerformanceVisualizer:
         ax.set_title('Throughput Metrics')
         ax.grid(True, alpha=0.3)
     
-    def plot_latency_distribution(self, latencies: List[float]):
-        """Plot latency distribution histogram."""
+    def _record_latency(self, latency: float):
+        """Fold one sample into the running histogram state."""
+        if self._lat_edges is None:
+            hi = max(latency * 4.0, 1e-6)
+            self._lat_edges = np.linspace(0.0, hi, self._lat_counts.size + 1)
+
+        # The history deque is full: its leftmost sample is about to be
+        # evicted, so retire it from the running state first
+        if len(self.latency_history) == self.latency_history.maxlen:
+            self._lat_sum -= self.latency_history[0]
+            self._lat_counts[self._lat_bins[0]] -= 1
+
+        idx = int(np.searchsorted(self._lat_edges, latency, side='right')) - 1
+        idx = min(max(idx, 0), self._lat_counts.size - 1)
+        self._lat_counts[idx] += 1
+        self._lat_bins.append(idx)
+        self._lat_sum += latency
+
+    def plot_latency_distribution(self, latencies):
+        """Plot latency distribution histogram from the running bin counts."""
         ax = self.axes[0, 2]
-        ax.clear()
-        
-        if not latencies:
-            ax.text(0.5, 0.5, 'No latency data', ha='center', va='center', 
+
+        if self._lat_edges is None:
+            ax.clear()
+            ax.text(0.5, 0.5, 'No latency data', ha='center', va='center',
                    transform=ax.transAxes)
             ax.set_title('Latency Distribution')
             return
-        
-        ax.hist(latencies, bins=30, alpha=0.7, color='skyblue', edgecolor='black')
-        ax.axvline(np.mean(latencies), color='red', linestyle='--', 
-                  label=f'Mean: {np.mean(latencies):.2f} μs')
-        ax.axvline(np.median(latencies), color='orange', linestyle='--', 
-                  label=f'Median: {np.median(latencies):.2f} μs')
-        
-        ax.set_xlabel('Latency (μs)')
-        ax.set_ylabel('Frequency')
-        ax.set_title('Latency Distribution')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
+
+        counts = self._lat_counts
+        edges = self._lat_edges
+
+        if self._lat_bars is None:
+            # First frame with data: build the persistent artists
+            ax.clear()
+            self._lat_bars = ax.bar(edges[:-1], counts, width=np.diff(edges),
+                                    align='edge', alpha=0.7, color='skyblue',
+                                    edgecolor='black')
+            self._lat_mean_line = ax.axvline(0.0, color='red', linestyle='--',
+                                             label='Mean')
+            self._lat_median_line = ax.axvline(0.0, color='orange', linestyle='--',
+                                               label='Median')
+            self._lat_legend = ax.legend()
+            ax.set_xlabel('Latency (μs)')
+            ax.set_ylabel('Frequency')
+            ax.set_title('Latency Distribution')
+            ax.grid(True, alpha=0.3)
+            self._dirty = True  # new labels/legend change panel geometry
+        else:
+            for rect, height in zip(self._lat_bars, counts):
+                rect.set_height(height)
+
+        # Exact mean from the running sum; median approximated from the
+        # bin where the cumulative count crosses half the window
+        n = len(self._lat_bins)
+        mean = self._lat_sum / n
+        median_bin = int(np.searchsorted(np.cumsum(counts), (n + 1) // 2))
+        median_bin = min(median_bin, counts.size - 1)
+        median = 0.5 * (edges[median_bin] + edges[median_bin + 1])
+
+        self._lat_mean_line.set_xdata([mean, mean])
+        self._lat_median_line.set_xdata([median, median])
+        mean_text, median_text = self._lat_legend.get_texts()
+        mean_text.set_text(f'Mean: {mean:.2f} μs')
+        median_text.set_text(f'Median: {median:.2f} μs')
+        ax.set_ylim(0, counts.max() * 1.05 + 1)
     
     def plot_performance_summary(self, metrics: Dict):
-        """Plot performance summary."""
-        ax = self.axes[1, 0]
-        ax.clear()
-        
-        # Create a summary table
-        summary_data = [
-            ['Orders Processed', f"{metrics.get('orders_processed', 0):,}"],
-            ['Trades Executed', f"{metrics.get('trades_executed', 0):,}"],
-            ['Market Data Updates', f"{metrics.get('market_data_updates', 0):,}"],
-            ['Avg Latency', f"{metrics.get('avg_latency_microseconds', 0):.2f} μs"]
-        ]
-        
-        table = ax.table(cellText=summary_data, colLabels=['Metric', 'Value'],
-                        cellLoc='center', loc='center')
-        table.auto_set_font_size(False)
-        table.set_fontsize(12)
-        table.scale(1, 2)
-        
-        ax.set_title('Performance Summary')
-        ax.axis('off')
+        """Plot performance summary by updating the pre-laid-out texts."""
+        texts = self._summary_texts
+        texts[0].set_text(f"{metrics.get('orders_processed', 0):,}")
+        texts[1].set_text(f"{metrics.get('trades_executed', 0):,}")
+        texts[2].set_text(f"{metrics.get('market_data_updates', 0):,}")
+        texts[3].set_text(f"{metrics.get('avg_latency_microseconds', 0):.2f} μs")
     
-    def plot_memory_usage(self, memory_data: List[Tuple[datetime, float]]):
+    def plot_memory_usage(self, memory_data: List[Tuple[float, float]]):
         """Plot memory usage over time."""
         ax = self.axes[1, 1]
         ax.clear()
@@ -292,9 +695,12 @@ class PerformanceVisualizer:
             ax.set_title('Memory Usage')
             return
         
-        timestamps, memory_values = zip(*memory_data)
+        memory_values = np.fromiter((m for _, m in memory_data),
+                                    dtype=np.float64, count=len(memory_data))
+        timestamps = [t for t, _ in memory_data]
         ax.plot(timestamps, memory_values, 'g-', linewidth=2, alpha=0.7)
         ax.fill_between(timestamps, memory_values, alpha=0.3, color='green')
+        ax.xaxis.set_major_formatter(self._time_fmt)
         
         ax.set_xlabel('Time')
         ax.set_ylabel('Memory Usage (MB)')
@@ -303,7 +709,7 @@ class PerformanceVisualizer:
         
         plt.setp(ax.get_xticklabels(), rotation=45)
     
-    def plot_cpu_usage(self, cpu_data: List[Tuple[datetime, float]]):
+    def plot_cpu_usage(self, cpu_data: List[Tuple[float, float]]):
         """Plot CPU usage over time."""
         ax = self.axes[1, 2]
         ax.clear()
@@ -314,9 +720,12 @@ class PerformanceVisualizer:
             ax.set_title('CPU Usage')
             return
         
-        timestamps, cpu_values = zip(*cpu_data)
+        cpu_values = np.fromiter((c for _, c in cpu_data),
+                                 dtype=np.float64, count=len(cpu_data))
+        timestamps = [t for t, _ in cpu_data]
         ax.plot(timestamps, cpu_values, 'r-', linewidth=2, alpha=0.7)
         ax.fill_between(timestamps, cpu_values, alpha=0.3, color='red')
+        ax.xaxis.set_major_formatter(self._time_fmt)
         
         ax.set_xlabel('Time')
         ax.set_ylabel('CPU Usage (%)')
@@ -325,64 +734,136 @@ class PerformanceVisualizer:
         
         plt.setp(ax.get_xticklabels(), rotation=45)
     
-    def update(self, metrics: Dict, latency: float = None, 
+    def update(self, metrics: Dict, latency: float = None,
                memory_mb: float = None, cpu_percent: float = None):
-        """Update all plots with new data."""
-        current_time = datetime.now()
+        """Update all plots with new data (every disp_skip-th call)."""
+        self._step += 1
+        if self._step % self.disp_skip:
+            return
+        # A repeated tick with identical metrics and samples carries no
+        # new information; skip the redraw (and the duplicate samples)
+        fp = hash((tuple(metrics.values()), latency, memory_mb, cpu_percent))
+        if fp == self._last_fp:
+            return
+        self._last_fp = fp
+        current_time = self._now()
         
         if latency is not None:
+            self._record_latency(latency)
             self.latency_history.append(latency)
             self.timestamps.append(current_time)
-            
-            # Keep only last 1000 data points
-            if len(self.latency_history) > 1000:
-                self.latency_history.pop(0)
-                self.timestamps.pop(0)
-        
+
+        # One contiguous copy of the window feeds every latency panel
+        latencies = np.fromiter(self.latency_history, dtype=np.float64,
+                                count=len(self.latency_history))
+
         self.plot_throughput_metrics(metrics)
-        self.plot_latency_distribution(self.latency_history)
+        self.plot_latency_distribution(latencies)
         self.plot_performance_summary(metrics)
-        
+
         if self.timestamps:
-            self.plot_latency_trend(self.latency_history, self.timestamps)
-        
+            self.plot_latency_trend(latencies, self.timestamps)
+
         # Update memory and CPU plots if data available
         if memory_mb is not None:
-            if not hasattr(self, 'memory_data'):
-                self.memory_data = []
             self.memory_data.append((current_time, memory_mb))
-            if len(self.memory_data) > 100:
-                self.memory_data.pop(0)
             self.plot_memory_usage(self.memory_data)
-        
+
         if cpu_percent is not None:
-            if not hasattr(self, 'cpu_data'):
-                self.cpu_data = []
             self.cpu_data.append((current_time, cpu_percent))
-            if len(self.cpu_data) > 100:
-                self.cpu_data.pop(0)
             self.plot_cpu_usage(self.cpu_data)
-        
-        plt.tight_layout()
-    
+
+        # tight_layout re-solves the whole figure layout; only pay for
+        # it when panel geometry actually changed (first frame, new
+        # artists), not on every data refresh
+        if self._dirty:
+            self.fig.tight_layout()
+            self._dirty = False
+        # Schedule a repaint instead of forcing a synchronous draw, then
+        # let the GUI event loop breathe
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
+
     def show(self):
         """Display the plots."""
         plt.show()
 
 
-class StrategyPerformanceVisualizer:
+class StrategyPerformanceVisualizer(_ReusableVisualizer):
     """Visualize strategy performance and PnL."""
-    
-    def __init__(self):
+
+    _instances = WeakValueDictionary()
+
+    def __init__(self, disp_skip: int = 1):
         self.fig, self.axes = plt.subplots(2, 2, figsize=(15, 10))
         self.fig.suptitle('Strategy Performance Visualization', fontsize=16)
-        
-        # Store historical data
-        self.pnl_history = []
-        self.position_history = []
-        self.timestamps = []
+
+        # Render every disp_skip-th update() call
+        self.disp_skip = disp_skip
+        self._step = 0
+        self._dirty = True  # layout re-solved only when geometry changes
+
+        # Rolling windows with O(1) eviction (see PerformanceVisualizer)
+        self._init_clock()
+        self.pnl_history = deque(maxlen=1000)  # (float seconds, pnl)
+        # Scalar-only shadow of pnl_history: fromiter can pull a float64
+        # array straight from it without unzipping the tuples
+        self._pnl_only = deque(maxlen=1000)
+        self.timestamps = deque(maxlen=1000)
+
+        # Column-oriented position history: one quantity/time deque per
+        # symbol, appended in O(1) per update, instead of re-scanning a
+        # window of position dicts per symbol per frame
+        self._pos_history: Dict[str, deque] = {}
+        self._pos_times: Dict[str, deque] = {}
+
+        # Returns maintained incrementally: one append per update instead
+        # of rebuilding the whole series from pnl_history every frame
+        self._returns = deque(maxlen=999)
+        self._last_pnl = None
+
+        # Running risk state folded in O(1) per sample: peak/drawdown
+        # scalars and return moments, so plot_risk_metrics never rescans
+        # the window. These track the full session, which is the natural
+        # horizon for drawdown.
+        self._peak = -np.inf
+        self._mdd = 0.0
+        self._first_pnl = None
+        self._ret_sum = 0.0
+        self._ret_sq = 0.0
+        self._n_ret = 0
+
+        # Position panel: axes dressed once, one persistent Line2D per
+        # symbol created on first sight and set_data thereafter
+        ax = self.axes[0, 1]
+        ax.set_title('Position Sizes Over Time')
+        ax.set_xlabel('Time')
+        ax.set_ylabel('Position Size')
+        ax.grid(True, alpha=0.3)
+        ax.xaxis.set_major_formatter(self._time_fmt)
+        ax.tick_params(axis='x', rotation=45)
+        self._pos_lines: Dict[str, plt.Line2D] = {}
+        self._pos_empty = ax.text(0.5, 0.5, 'No position data', ha='center',
+                                  va='center', transform=ax.transAxes)
+        self._pos_empty.set_visible(False)
+
+        # Risk panel: fixed Text artists updated in place (see the
+        # performance summary panel for the rationale vs ax.table)
+        ax = self.axes[1, 1]
+        ax.set_title('Risk Metrics Summary')
+        ax.axis('off')
+        self._risk_texts = []
+        for i, label in enumerate(('Volatility', 'Sharpe Ratio',
+                                   'Max Drawdown', 'Total Return')):
+            y = 0.8 - 0.2 * i
+            ax.text(0.05, y, label, fontsize=12, transform=ax.transAxes)
+            self._risk_texts.append(
+                ax.text(0.60, y, '', fontsize=12, transform=ax.transAxes))
+        self._risk_empty = ax.text(0.5, 0.5, 'No PnL data', ha='center',
+                                   va='center', transform=ax.transAxes)
+        self._risk_empty.set_visible(False)
     
-    def plot_pnl_trend(self, pnl_data: List[Tuple[datetime, float]]):
+    def plot_pnl_trend(self, pnl_data: List[Tuple[float, float]]):
         """Plot PnL trend over time."""
         ax = self.axes[0, 0]
         ax.clear()
@@ -393,9 +874,16 @@ class StrategyPerformanceVisualizer:
             ax.set_title('PnL Trend')
             return
         
-        timestamps, pnl_values = zip(*pnl_data)
+        if pnl_data is self.pnl_history:
+            pnl_values = np.fromiter(self._pnl_only, dtype=np.float64,
+                                     count=len(self._pnl_only))
+            timestamps = np.fromiter((t for t, _ in pnl_data),
+                                     dtype=np.float64, count=len(pnl_data))
+        else:
+            timestamps, pnl_values = zip(*pnl_data)
         ax.plot(timestamps, pnl_values, 'g-', linewidth=2, alpha=0.7)
         ax.fill_between(timestamps, pnl_values, alpha=0.3, color='green')
+        ax.xaxis.set_major_formatter(self._time_fmt)
         
         # Add zero line
         ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
@@ -407,52 +895,51 @@ class StrategyPerformanceVisualizer:
         
         plt.setp(ax.get_xticklabels(), rotation=45)
     
-    def plot_position_sizes(self, position_data: List[Tuple[datetime, Dict]]):
-        """Plot position sizes over time."""
+    def plot_position_sizes(self):
+        """Plot per-symbol position sizes from the column-oriented history."""
         ax = self.axes[0, 1]
-        ax.clear()
-        
-        if not position_data:
-            ax.text(0.5, 0.5, 'No position data', ha='center', va='center', 
-                   transform=ax.transAxes)
-            ax.set_title('Position Sizes')
+
+        if not self._pos_history:
+            self._pos_empty.set_visible(True)
             return
-        
-        timestamps, positions = zip(*position_data)
-        
-        # Extract symbols and their quantities
-        symbols = set()
-        for pos_dict in positions:
-            symbols.update(pos_dict.keys())
-        
-        for symbol in symbols:
-            quantities = [pos_dict.get(symbol, {}).get('quantity', 0) for pos_dict in positions]
-            ax.plot(timestamps, quantities, linewidth=2, alpha=0.7, label=symbol)
-        
-        ax.set_xlabel('Time')
-        ax.set_ylabel('Position Size')
-        ax.set_title('Position Sizes Over Time')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        
-        plt.setp(ax.get_xticklabels(), rotation=45)
+        self._pos_empty.set_visible(False)
+
+        for symbol, quantities in self._pos_history.items():
+            line = self._pos_lines.get(symbol)
+            if line is None:
+                line, = ax.plot([], [], linewidth=2, alpha=0.7, label=symbol)
+                self._pos_lines[symbol] = line
+                ax.legend()
+                self._dirty = True  # legend grows with the symbol set
+            times = self._pos_times[symbol]
+            line.set_data(np.fromiter(times, dtype=np.float64,
+                                      count=len(times)),
+                          np.fromiter(quantities, dtype=np.float64,
+                                      count=len(quantities)))
+
+        ax.relim()
+        ax.autoscale_view()
     
     def plot_returns_distribution(self, returns: List[float]):
         """Plot returns distribution."""
         ax = self.axes[1, 0]
         ax.clear()
         
-        if not returns:
-            ax.text(0.5, 0.5, 'No returns data', ha='center', va='center', 
+        if not len(returns):
+            ax.text(0.5, 0.5, 'No returns data', ha='center', va='center',
                    transform=ax.transAxes)
             ax.set_title('Returns Distribution')
             return
         
+        # One statistics pass each; the f-strings reuse the bound floats
+        mean_ret = float(np.mean(returns))
+        median_ret = float(np.median(returns))
+
         ax.hist(returns, bins=30, alpha=0.7, color='lightcoral', edgecolor='black')
-        ax.axvline(np.mean(returns), color='red', linestyle='--', 
-                  label=f'Mean: {np.mean(returns):.4f}')
-        ax.axvline(np.median(returns), color='orange', linestyle='--', 
-                  label=f'Median: {np.median(returns):.4f}')
+        ax.axvline(mean_ret, color='red', linestyle='--',
+                  label=f'Mean: {mean_ret:.4f}')
+        ax.axvline(median_ret, color='orange', linestyle='--',
+                  label=f'Median: {median_ret:.4f}')
         
         ax.set_xlabel('Returns')
         ax.set_ylabel('Frequency')
@@ -460,83 +947,103 @@ class StrategyPerformanceVisualizer:
         ax.legend()
         ax.grid(True, alpha=0.3)
     
-    def plot_risk_metrics(self, pnl_data: List[Tuple[datetime, float]]):
-        """Plot risk metrics."""
-        ax = self.axes[1, 1]
-        ax.clear()
-        
+    def plot_risk_metrics(self, pnl_data):
+        """Plot risk metrics by updating the pre-laid-out texts."""
         if not pnl_data:
-            ax.text(0.5, 0.5, 'No PnL data', ha='center', va='center', 
-                   transform=ax.transAxes)
-            ax.set_title('Risk Metrics')
+            self._risk_empty.set_visible(True)
             return
-        
-        # Calculate risk metrics
-        _, pnl_values = zip(*pnl_data)
-        pnl_values = np.array(pnl_values)
-        
-        # Calculate daily returns (assuming data is daily)
-        if len(pnl_values) > 1:
-            returns = np.diff(pnl_values) / pnl_values[:-1]
-            
-            # Risk metrics
-            volatility = np.std(returns) * np.sqrt(252)  # Annualized
-            sharpe_ratio = np.mean(returns) / np.std(returns) * np.sqrt(252) if np.std(returns) > 0 else 0
-            max_drawdown = np.min(pnl_values - np.maximum.accumulate(pnl_values))
-            
-            # Create summary table
-            summary_data = [
-                ['Volatility', f'{volatility:.2%}'],
-                ['Sharpe Ratio', f'{sharpe_ratio:.2f}'],
-                ['Max Drawdown', f'${max_drawdown:.2f}'],
-                ['Total Return', f'${pnl_values[-1] - pnl_values[0]:.2f}']
-            ]
-            
-            table = ax.table(cellText=summary_data, colLabels=['Metric', 'Value'],
-                            cellLoc='center', loc='center')
-            table.auto_set_font_size(False)
-            table.set_fontsize(12)
-            table.scale(1, 2)
-            
-            ax.set_title('Risk Metrics Summary')
-            ax.axis('off')
+        self._risk_empty.set_visible(False)
+
+        if self._n_ret > 0:
+            # Running state maintained in update(): no window rescan
+            ret_sum, ret_sq, count = self._ret_sum, self._ret_sq, self._n_ret
+            max_drawdown = self._mdd
+            total_return = self._last_pnl - self._first_pnl
+        else:
+            # Direct callers that bypass update() still get the fused scan
+            pnl_values = np.fromiter((p for _, p in pnl_data),
+                                     dtype=np.float64, count=len(pnl_data))
+            if len(pnl_values) < 2:
+                return
+            ret_sum, ret_sq, count, max_drawdown = _risk_scan(pnl_values)
+            total_return = pnl_values[-1] - pnl_values[0]
+
+        volatility = 0.0
+        sharpe_ratio = 0
+        if count > 0:
+            mean_ret = ret_sum / count
+            std_ret = np.sqrt(max(ret_sq / count - mean_ret * mean_ret, 0.0))
+            volatility = std_ret * np.sqrt(252)  # Annualized
+            if std_ret > 0:
+                sharpe_ratio = mean_ret / std_ret * np.sqrt(252)
+
+        texts = self._risk_texts
+        texts[0].set_text(f'{volatility:.2%}')
+        texts[1].set_text(f'{sharpe_ratio:.2f}')
+        texts[2].set_text(f'${max_drawdown:.2f}')
+        texts[3].set_text(f'${total_return:.2f}')
     
     def update(self, portfolio_summary: Dict):
-        """Update all plots with new data."""
-        current_time = datetime.now()
+        """Update all plots with new data (every disp_skip-th call)."""
+        self._step += 1
+        if self._step % self.disp_skip:
+            return
+        current_time = self._now()
         
-        # Update PnL data
+        # Update PnL data; fold the step return into the rolling window
+        # and the running risk state
         total_pnl = portfolio_summary.get('total_pnl', 0.0)
+        if self._last_pnl is not None and self._last_pnl != 0:
+            step = total_pnl - self._last_pnl
+            # Distribution panel uses the sign-preserving abs-denominator
+            # series; the risk moments divide by the signed previous PnL
+            # so they match _risk_scan and the baseline risk metrics
+            self._returns.append(step / abs(self._last_pnl))
+            risk_return = step / self._last_pnl
+            self._ret_sum += risk_return
+            self._ret_sq += risk_return * risk_return
+            self._n_ret += 1
+        self._last_pnl = total_pnl
+        if self._first_pnl is None:
+            self._first_pnl = total_pnl
+        if total_pnl > self._peak:
+            self._peak = total_pnl
+        drawdown = total_pnl - self._peak
+        if drawdown < self._mdd:
+            self._mdd = drawdown
         self.pnl_history.append((current_time, total_pnl))
-        if len(self.pnl_history) > 1000:
-            self.pnl_history.pop(0)
-        
-        # Update position data
+        self._pnl_only.append(total_pnl)
+
+        # Append into the per-symbol columns in O(1) per symbol
         positions = portfolio_summary.get('positions', {})
-        self.position_history.append((current_time, positions))
-        if len(self.position_history) > 1000:
-            self.position_history.pop(0)
-        
+        for symbol, pos in positions.items():
+            self._pos_history.setdefault(symbol, deque(maxlen=1000)).append(
+                pos.get('quantity', 0))
+            self._pos_times.setdefault(symbol, deque(maxlen=1000)).append(
+                current_time)
+
         # Update plots
         self.plot_pnl_trend(self.pnl_history)
-        self.plot_position_sizes(self.position_history)
-        
-        # Calculate returns for distribution
-        if len(self.pnl_history) > 1:
-            returns = []
-            for i in range(1, len(self.pnl_history)):
-                prev_pnl = self.pnl_history[i-1][1]
-                curr_pnl = self.pnl_history[i][1]
-                if prev_pnl != 0:
-                    returns.append((curr_pnl - prev_pnl) / abs(prev_pnl))
-            
-            if returns:
-                self.plot_returns_distribution(returns)
+        self.plot_position_sizes()
+
+        if self._returns:
+            self.plot_returns_distribution(
+                np.fromiter(self._returns, dtype=np.float64,
+                            count=len(self._returns)))
         
         self.plot_risk_metrics(self.pnl_history)
-        
-        plt.tight_layout()
-    
+
+        # tight_layout re-solves the whole figure layout; only pay for
+        # it when panel geometry actually changed (first frame, new
+        # artists), not on every data refresh
+        if self._dirty:
+            self.fig.tight_layout()
+            self._dirty = False
+        # Schedule a repaint instead of forcing a synchronous draw, then
+        # let the GUI event loop breathe
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
+
     def show(self):
         """Display the plots."""
         plt.show()
@@ -545,18 +1052,19 @@ class StrategyPerformanceVisualizer:
 def create_dashboard(order_book_snapshots: Dict[str, any], 
                     performance_metrics: Dict, 
                     portfolio_summary: Dict):
-    """Create a comprehensive dashboard with all visualizations."""
-    # Create order book visualizer
-    ob_viz = OrderBookVisualizer()
-    
-    # Create performance visualizer
-    perf_viz = PerformanceVisualizer()
-    
-    # Create strategy performance visualizer
-    strat_viz = StrategyPerformanceVisualizer()
-    
+    """Create a comprehensive dashboard with all visualizations.
+
+    Instances are cached per process (per symbol for the order book), so
+    repeated calls reuse the already-built figures instead of paying
+    subplot construction again.
+    """
+    perf_viz = PerformanceVisualizer.get_or_create()
+    strat_viz = StrategyPerformanceVisualizer.get_or_create()
+
     # Update visualizations with data
+    ob_viz = None
     for symbol, snapshot in order_book_snapshots.items():
+        ob_viz = OrderBookVisualizer.get_or_create(symbol)
         ob_viz.update(snapshot, symbol)
         break  # Just show first symbol for now
     
@@ -246,6 +246,10 @@ bool MarketDataProcessor::start() {
 
     try {
         // Start data source
+        if (data_source_ && !data_source_->is_connected() && !data_source_->connect()) {
+            std::cerr << "Failed to connect data source" << std::endl;
+            return false;
+        }
         if (data_source_ && !data_source_->start_streaming()) {
             std::cerr << "Failed to start data source" << std::endl;
             return false;
@@ -271,7 +271,7 @@ size_t MemoryTracker::get_process_memory_usage() const {
 
 // CPUTracker implementation
 CPUTracker::CPUTracker() : last_cpu_time_(0.0) {
-    last_update_ = std::chrono::high_resolution_clock::now();
+    last_update_ = std::chrono::steady_clock::now();
     update_cpu_usage();
 }
 
@@ -280,7 +280,7 @@ CPUTracker::~CPUTracker() {
 }
 
 void CPUTracker::update_cpu_usage() {
-    auto now = std::chrono::high_resolution_clock::now();
+    auto now = std::chrono::steady_clock::now();
     double current_cpu_time = get_process_cpu_time();
     double system_cpu_time = get_system_cpu_time();
     
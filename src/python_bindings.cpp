@@ -2,10 +2,14 @@
 #include <pybind11/stl.h>
 #include <pybind11/functional.h>
 #include <pybind11/chrono.h>
+#include <pybind11/numpy.h>
 #include "order_matching_engine.h"
 #include "order_book.h"
 #include "market_data.h"
 #include "performance_monitor.h"
+#include <iostream>
+#include <shared_mutex>
+#include <unordered_map>
 
 namespace py = pybind11;
 using namespace UltraFastAnalysis;
@@ -27,7 +31,24 @@ public:
     }
     
     std::shared_ptr<Order> get_order() const { return order_; }
-    
+
+    // Re-initialize the underlying order in place so Python-side pools can
+    // recycle Order objects instead of constructing a new one per submission.
+    void reset(uint64_t order_id, uint64_t client_id, const std::string& symbol,
+               const std::string& side, const std::string& type, uint64_t quantity, double price) {
+        order_->order_id = order_id;
+        order_->client_id = client_id;
+        order_->symbol = symbol;
+        order_->side = (side == "BUY") ? OrderSide::BUY : OrderSide::SELL;
+        order_->type = (type == "MARKET") ? OrderType::MARKET : OrderType::LIMIT;
+        order_->quantity = quantity;
+        order_->filled_quantity = 0;
+        order_->price = price;
+        order_->stop_price = 0.0;
+        order_->timestamp = std::chrono::high_resolution_clock::now();
+        order_->status = OrderStatus::PENDING;
+    }
+
     // Getters
     uint64_t get_order_id() const { return order_->order_id; }
     uint64_t get_client_id() const { return order_->client_id; }
@@ -65,16 +86,21 @@ private:
 // Python wrapper for MarketData
 class PyMarketData {
 public:
-    PyMarketData(const std::string& symbol, const std::string& type, double price, uint64_t quantity)
+    PyMarketData(const std::string& symbol, const std::string& type, double price, uint64_t quantity,
+                 double bid_price = 0.0, double ask_price = 0.0)
         : data_() {
         data_.symbol = symbol;
-        data_.type = (type == "TRADE") ? MarketDataType::TRADE : 
+        data_.type = (type == "TRADE") ? MarketDataType::TRADE :
                     (type == "QUOTE") ? MarketDataType::QUOTE : MarketDataType::TICK;
         data_.timestamp = std::chrono::high_resolution_clock::now();
         data_.price = price;
         data_.quantity = quantity;
+        data_.bid_price = bid_price;
+        data_.ask_price = ask_price;
     }
-    
+
+    explicit PyMarketData(const MarketData& data) : data_(data) {}
+
     const MarketData& get_data() const { return data_; }
     
     // Getters
@@ -90,11 +116,32 @@ public:
     }
     double get_price() const { return data_.price; }
     uint64_t get_quantity() const { return data_.quantity; }
+    double get_bid_price() const { return data_.bid_price; }
+    double get_ask_price() const { return data_.ask_price; }
     
 private:
     MarketData data_;
 };
 
+// Price level layout shared with NumPy (dtype [('price','f8'),('quantity','u8')])
+struct BookLevel {
+    double price;
+    uint64_t quantity;
+};
+static_assert(sizeof(BookLevel) == sizeof(std::pair<double, uint64_t>),
+              "BookLevel must match the snapshot's level layout");
+
+// One row of a batch submission; side/type carry the engine's own uint8
+// enum encodings (OrderSide/OrderType) and prices are int64 cents.
+struct OrderRow {
+    uint64_t order_id;
+    uint64_t client_id;
+    uint8_t side;
+    uint8_t type;
+    uint64_t quantity;
+    int64_t price_cents;
+};
+
 // Python wrapper for OrderBookSnapshot
 class PyOrderBookSnapshot {
 public:
@@ -127,7 +174,20 @@ public:
         }
         return result;
     }
-    
+
+    // Zero-copy structured-array views over the level vectors: indexing
+    // bids_array['price'][0] reads a C double directly, with no per-level
+    // dict or Python float construction. The base object keeps the
+    // snapshot alive for the lifetime of the view.
+    static py::array levels_array(const std::vector<std::pair<double, uint64_t>>& levels,
+                                  py::object base) {
+        return py::array(py::dtype::of<BookLevel>(), {levels.size()},
+                         {sizeof(BookLevel)}, levels.data(), base);
+    }
+
+    const std::vector<std::pair<double, uint64_t>>& bids() const { return snapshot_.bids; }
+    const std::vector<std::pair<double, uint64_t>>& asks() const { return snapshot_.asks; }
+
 private:
     OrderBookSnapshot snapshot_;
 };
@@ -135,28 +195,71 @@ private:
 // Python wrapper for OrderMatchingEngine
 class PyOrderMatchingEngine {
 public:
-    PyOrderMatchingEngine(size_t num_matching_threads = 4, size_t num_market_data_threads = 2)
-        : engine_(std::make_unique<OrderMatchingEngine>()) {
-        
+    PyOrderMatchingEngine(size_t num_matching_threads = 4, size_t num_market_data_threads = 2) {
         EngineConfig config;
         config.num_matching_threads = num_matching_threads;
         config.num_market_data_threads = num_market_data_threads;
         config.enable_performance_monitoring = true;
-        
+
         engine_ = std::make_unique<OrderMatchingEngine>(config);
     }
     
     bool start() { return engine_->start(); }
     void stop() { engine_->stop(); }
     bool is_running() const { return engine_->is_running(); }
+
+    // Process-wide unique order ids from one relaxed atomic increment;
+    // unlike a Python-side counter, ids are never reused after a failed
+    // submit and never collide across strategies or symbols.
+    uint64_t next_order_id() {
+        return next_order_id_.fetch_add(1, std::memory_order_relaxed);
+    }
     
     bool submit_order(const PyOrder& py_order) {
-        return engine_->submit_order(py_order.get_order());
+        // Hand the engine its own copy: the matching threads keep the order
+        // alive in the book, so the Python-side object stays free to be
+        // reset and recycled immediately after this call returns.
+        return engine_->submit_order(std::make_shared<Order>(*py_order.get_order()));
     }
     
+    // Submit a batch of orders for one symbol from a structured array
+    // (ORDER_ROW_DTYPE) in a single boundary crossing: one argument
+    // conversion pass instead of one per order. Returns the accepted count.
+    size_t submit_orders(py::array_t<OrderRow, py::array::c_style | py::array::forcecast> orders,
+                         const std::string& symbol) {
+        auto rows = orders.unchecked<1>();
+        size_t accepted = 0;
+        for (py::ssize_t i = 0; i < rows.shape(0); ++i) {
+            const OrderRow& row = rows(i);
+            auto order = std::make_shared<Order>(
+                row.order_id, row.client_id, symbol,
+                static_cast<OrderSide>(row.side), static_cast<OrderType>(row.type),
+                row.quantity, static_cast<double>(row.price_cents) * 0.01);
+            if (engine_->submit_order(order)) {
+                ++accepted;
+            }
+        }
+        return accepted;
+    }
+
     bool cancel_order(uint64_t order_id, const std::string& symbol) {
         return engine_->cancel_order(order_id, symbol);
     }
+
+    // Cancel a batch of orders for one symbol from a contiguous int64
+    // buffer in a single boundary crossing; negative ids are empty slots
+    // and are skipped. Returns the number of orders actually cancelled.
+    size_t cancel_orders_bulk(py::array_t<int64_t, py::array::c_style | py::array::forcecast> order_ids,
+                              const std::string& symbol) {
+        auto ids = order_ids.unchecked<1>();
+        size_t cancelled = 0;
+        for (py::ssize_t i = 0; i < ids.shape(0); ++i) {
+            if (ids(i) >= 0 && engine_->cancel_order(static_cast<uint64_t>(ids(i)), symbol)) {
+                ++cancelled;
+            }
+        }
+        return cancelled;
+    }
     
     bool modify_order(uint64_t order_id, const std::string& symbol, 
                      uint64_t new_quantity, double new_price) {
@@ -171,6 +274,26 @@ public:
         auto snapshot = engine_->get_order_book_snapshot(symbol);
         return PyOrderBookSnapshot(snapshot);
     }
+
+    // Bulk top-of-book fetch: one boundary crossing returns best bid/ask for
+    // every requested symbol as two contiguous float64 arrays (0.0 where the
+    // book is empty), instead of one snapshot copy per symbol.
+    py::tuple get_tops(const std::vector<std::string>& symbols) const {
+        py::array_t<double> bids(symbols.size());
+        py::array_t<double> asks(symbols.size());
+        auto b = bids.mutable_unchecked<1>();
+        auto a = asks.mutable_unchecked<1>();
+        for (size_t i = 0; i < symbols.size(); ++i) {
+            if (auto book = engine_->get_order_book(symbols[i])) {
+                b(i) = book->get_best_bid();
+                a(i) = book->get_best_ask();
+            } else {
+                b(i) = 0.0;
+                a(i) = 0.0;
+            }
+        }
+        return py::make_tuple(bids, asks);
+    }
     
     // Performance metrics
     py::dict get_performance_metrics() const {
@@ -200,15 +323,120 @@ public:
     
     // Set callbacks
     void set_market_data_callback(py::function callback) {
-        engine_->set_market_data_callback([callback](const MarketData& data) {
+        {
+            std::unique_lock<std::shared_mutex> lock(callback_mutex_);
+            md_callback_ = callback;
+        }
+        install_dispatcher();
+    }
+
+    // Multicast subscription: one market-data event fans out to every
+    // subscriber under a single GIL acquisition, instead of later
+    // subscribers silently replacing earlier ones. Returns a handle.
+    size_t add_market_data_subscriber(py::function callback) {
+        size_t handle;
+        {
+            std::unique_lock<std::shared_mutex> lock(callback_mutex_);
+            handle = subscribers_.size();
+            subscribers_.push_back(callback);
+        }
+        install_dispatcher();
+        return handle;
+    }
+
+    // Register a C++-evaluated spread trigger: the market-data thread compares
+    // best_ask - best_bid against the threshold in-process and only crosses
+    // into Python (GIL + callback) when the trigger fires.
+    void register_spread_trigger(const std::string& symbol, double threshold, py::function on_fire) {
+        {
+            std::unique_lock<std::shared_mutex> lock(callback_mutex_);
+            spread_triggers_[symbol] = threshold;
+            spread_callbacks_[symbol] = on_fire;
+        }
+        install_dispatcher();
+    }
+
+private:
+    void install_dispatcher() {
+        if (dispatcher_installed_) {
+            return;
+        }
+        dispatcher_installed_ = true;
+
+        engine_->set_market_data_callback([this](const MarketData& data) {
+            MarketData enriched = data;
+            // Fill in top-of-book quotes before crossing into Python so
+            // strategies can cache best bid/ask without snapshot copies.
+            if (enriched.bid_price <= 0.0 || enriched.ask_price <= 0.0) {
+                if (auto book = engine_->get_order_book(enriched.symbol)) {
+                    enriched.bid_price = book->get_best_bid();
+                    enriched.ask_price = book->get_best_ask();
+                }
+            }
+
+            // Evaluate spread triggers while still off the GIL.
+            bool fired = false;
+            {
+                std::shared_lock<std::shared_mutex> lock(callback_mutex_);
+                auto it = spread_triggers_.find(enriched.symbol);
+                fired = it != spread_triggers_.end() &&
+                        enriched.bid_price > 0.0 && enriched.ask_price > 0.0 &&
+                        (enriched.ask_price - enriched.bid_price) > it->second;
+            }
+
             py::gil_scoped_acquire gil;
-            PyMarketData py_data(data.symbol, "TICK", data.price, data.quantity);
-            callback(py_data);
+
+            // Snapshot the callbacks under the shared lock, then drop it
+            // before calling into Python: registrars take the unique lock
+            // while holding the GIL, so invoking callbacks with
+            // callback_mutex_ held deadlocks against a concurrent
+            // register. Copying needs the GIL (refcounts), which is why
+            // the snapshot happens after the acquire above.
+            py::function md_callback;
+            std::vector<py::function> subscribers;
+            py::function fire_callback;
+            {
+                std::shared_lock<std::shared_mutex> lock(callback_mutex_);
+                md_callback = md_callback_;
+                subscribers = subscribers_;
+                if (fired) {
+                    auto cb = spread_callbacks_.find(enriched.symbol);
+                    if (cb != spread_callbacks_.end()) {
+                        fire_callback = cb->second;
+                    }
+                }
+            }
+
+            // Single exception guard at the C++/Python boundary: callback
+            // bodies stay free of try/except, and a raising strategy is
+            // logged without killing the market-data thread.
+            try {
+                if (md_callback || !subscribers.empty()) {
+                    py::object py_data = py::cast(PyMarketData(enriched));
+                    if (md_callback) {
+                        md_callback(py_data);
+                    }
+                    for (const auto& subscriber : subscribers) {
+                        subscriber(py_data);
+                    }
+                }
+                if (fire_callback) {
+                    fire_callback(enriched.symbol, enriched.bid_price, enriched.ask_price);
+                }
+            } catch (py::error_already_set& e) {
+                std::cerr << "Market data callback raised: " << e.what() << std::endl;
+            }
         });
     }
-    
-private:
+
     std::unique_ptr<OrderMatchingEngine> engine_;
+    std::atomic<uint64_t> next_order_id_{10000};
+    bool dispatcher_installed_ = false;
+    mutable std::shared_mutex callback_mutex_;
+    py::function md_callback_;
+    std::vector<py::function> subscribers_;
+    std::unordered_map<std::string, double> spread_triggers_;
+    std::unordered_map<std::string, py::function> spread_callbacks_;
 };
 
 // Python wrapper for PerformanceMonitor
@@ -259,6 +487,9 @@ PYBIND11_MODULE(order_engine_python, m) {
                       const std::string&, uint64_t, double>(),
              py::arg("order_id"), py::arg("client_id"), py::arg("symbol"), 
              py::arg("side"), py::arg("type"), py::arg("quantity"), py::arg("price"))
+        .def("reset", &PyOrder::reset,
+             py::arg("order_id"), py::arg("client_id"), py::arg("symbol"),
+             py::arg("side"), py::arg("type"), py::arg("quantity"), py::arg("price"))
         .def_property_readonly("order_id", &PyOrder::get_order_id)
         .def_property_readonly("client_id", &PyOrder::get_client_id)
         .def_property_readonly("symbol", &PyOrder::get_symbol)
@@ -271,18 +502,32 @@ PYBIND11_MODULE(order_engine_python, m) {
     
     // MarketData class
     py::class_<PyMarketData>(m, "MarketData")
-        .def(py::init<const std::string&, const std::string&, double, uint64_t>(),
-             py::arg("symbol"), py::arg("type"), py::arg("price"), py::arg("quantity"))
+        .def(py::init<const std::string&, const std::string&, double, uint64_t, double, double>(),
+             py::arg("symbol"), py::arg("type"), py::arg("price"), py::arg("quantity"),
+             py::arg("bid_price") = 0.0, py::arg("ask_price") = 0.0)
         .def_property_readonly("symbol", &PyMarketData::get_symbol)
         .def_property_readonly("type", &PyMarketData::get_type)
         .def_property_readonly("price", &PyMarketData::get_price)
-        .def_property_readonly("quantity", &PyMarketData::get_quantity);
+        .def_property_readonly("quantity", &PyMarketData::get_quantity)
+        .def_property_readonly("bid_price", &PyMarketData::get_bid_price)
+        .def_property_readonly("ask_price", &PyMarketData::get_ask_price);
     
     // OrderBookSnapshot class
+    PYBIND11_NUMPY_DTYPE(BookLevel, price, quantity);
+    PYBIND11_NUMPY_DTYPE(OrderRow, order_id, client_id, side, type,
+                         quantity, price_cents);
     py::class_<PyOrderBookSnapshot>(m, "OrderBookSnapshot")
         .def_property_readonly("symbol", &PyOrderBookSnapshot::get_symbol)
         .def_property_readonly("bids", &PyOrderBookSnapshot::get_bids_list)
-        .def_property_readonly("asks", &PyOrderBookSnapshot::get_asks_list);
+        .def_property_readonly("asks", &PyOrderBookSnapshot::get_asks_list)
+        .def_property_readonly("bids_array", [](py::object self) {
+            return PyOrderBookSnapshot::levels_array(
+                self.cast<const PyOrderBookSnapshot&>().bids(), self);
+        })
+        .def_property_readonly("asks_array", [](py::object self) {
+            return PyOrderBookSnapshot::levels_array(
+                self.cast<const PyOrderBookSnapshot&>().asks(), self);
+        });
     
     // OrderMatchingEngine class
     py::class_<PyOrderMatchingEngine>(m, "OrderMatchingEngine")
@@ -292,16 +537,26 @@ PYBIND11_MODULE(order_engine_python, m) {
         .def("start", &PyOrderMatchingEngine::start)
         .def("stop", &PyOrderMatchingEngine::stop)
         .def("is_running", &PyOrderMatchingEngine::is_running)
+        .def("next_order_id", &PyOrderMatchingEngine::next_order_id)
         .def("submit_order", &PyOrderMatchingEngine::submit_order)
+        .def("submit_orders", &PyOrderMatchingEngine::submit_orders,
+             py::arg("orders"), py::arg("symbol"))
         .def("cancel_order", &PyOrderMatchingEngine::cancel_order)
+        .def("cancel_orders_bulk", &PyOrderMatchingEngine::cancel_orders_bulk,
+             py::arg("order_ids"), py::arg("symbol"))
         .def("modify_order", &PyOrderMatchingEngine::modify_order)
         .def("submit_market_data", &PyOrderMatchingEngine::submit_market_data)
         .def("get_order_book_snapshot", &PyOrderMatchingEngine::get_order_book_snapshot)
+        .def("get_tops", &PyOrderMatchingEngine::get_tops, py::arg("symbols"))
         .def("get_performance_metrics", &PyOrderMatchingEngine::get_performance_metrics)
         .def("get_total_order_count", &PyOrderMatchingEngine::get_total_order_count)
         .def("get_total_trade_count", &PyOrderMatchingEngine::get_total_trade_count)
         .def("get_active_symbols", &PyOrderMatchingEngine::get_active_symbols)
-        .def("set_market_data_callback", &PyOrderMatchingEngine::set_market_data_callback);
+        .def("set_market_data_callback", &PyOrderMatchingEngine::set_market_data_callback)
+        .def("add_market_data_subscriber", &PyOrderMatchingEngine::add_market_data_subscriber,
+             py::arg("callback"))
+        .def("register_spread_trigger", &PyOrderMatchingEngine::register_spread_trigger,
+             py::arg("symbol"), py::arg("threshold"), py::arg("on_fire"));
     
     // PerformanceMonitor class
     py::class_<PyPerformanceMonitor>(m, "PerformanceMonitor")
@@ -326,6 +581,13 @@ PYBIND11_MODULE(order_engine_python, m) {
     m.attr("MARKET_DATA_TYPE_TRADE") = "TRADE";
     m.attr("MARKET_DATA_TYPE_QUOTE") = "QUOTE";
     m.attr("MARKET_DATA_TYPE_TICK") = "TICK";
+
+    // Batch-submission row layout plus the numeric enum encodings it uses
+    m.attr("ORDER_ROW_DTYPE") = py::dtype::of<OrderRow>();
+    m.attr("ORDER_ROW_SIDE_BUY") = static_cast<uint8_t>(OrderSide::BUY);
+    m.attr("ORDER_ROW_SIDE_SELL") = static_cast<uint8_t>(OrderSide::SELL);
+    m.attr("ORDER_ROW_TYPE_MARKET") = static_cast<uint8_t>(OrderType::MARKET);
+    m.attr("ORDER_ROW_TYPE_LIMIT") = static_cast<uint8_t>(OrderType::LIMIT);
     
     // Example usage function
     m.def("example_usage", []() {